@@ -5,14 +5,19 @@ from flask_migrate import Migrate
 from flask_jwt_extended import JWTManager
 from flask_cors import CORS
 from flask_marshmallow import Marshmallow
+from flask_caching import Cache
+from marshmallow import ValidationError
+from werkzeug.exceptions import HTTPException
 
 from app.config import config
+from app.utils import OrjsonProvider
 
 # Initialize extensions
 db = SQLAlchemy()
 migrate = Migrate()
 jwt = JWTManager()
 ma = Marshmallow()
+cache = Cache()
 
 
 def create_app(config_name='default'):
@@ -22,11 +27,15 @@ def create_app(config_name='default'):
     # Load configuration
     app.config.from_object(config[config_name])
     
+    # Serialize JSON responses with orjson
+    app.json = OrjsonProvider(app)
+    
     # Initialize extensions
     db.init_app(app)
     migrate.init_app(app, db)
     jwt.init_app(app)
     ma.init_app(app)
+    cache.init_app(app)
     CORS(app, origins=app.config['CORS_ORIGINS'], supports_credentials=True)
     
     # JWT error handlers
@@ -85,6 +94,19 @@ def create_app(config_name='default'):
         db.session.rollback()
         return jsonify({'error': 'Internal server error', 'message': 'Something went wrong'}), 500
     
+    @app.errorhandler(ValidationError)
+    def validation_error(error):
+        return jsonify({'error': 'Validation error', 'messages': error.messages}), 400
+    
+    @app.errorhandler(Exception)
+    def unhandled_exception(error):
+        # Let HTTP errors (abort, first_or_404, ...) reach their own handlers
+        if isinstance(error, HTTPException):
+            return error
+        db.session.rollback()
+        app.logger.exception('Unhandled exception')
+        return jsonify({'error': 'Internal server error', 'message': 'Something went wrong'}), 500
+    
     # Health check endpoint
     @app.route('/api/v1/health')
     def health_check():
@@ -9,7 +9,7 @@ from decimal import Decimal
 from app import db
 from app.budgets import budgets_bp
 from app.models import Budget, Category, Transaction
-from app.schemas import BudgetSchema
+from app.schemas import BudgetSchema, dump_budget
 
 
 budget_schema = BudgetSchema()
@@ -45,9 +45,9 @@ def get_budgets():
                 extract('year', Transaction.date) == budget.year
             ).scalar() or Decimal('0')
             
-            budget_dict = budget_schema.dump(budget)
-            budget_dict['spent'] = str(spent)
-            budget_dict['remaining'] = str(budget.amount - spent)
+            budget_dict = dump_budget(budget)
+            budget_dict['spent'] = format(spent, '.2f')
+            budget_dict['remaining'] = format(budget.amount - spent, '.2f')
             budget_dict['percentage'] = round((spent / budget.amount * 100), 2) if budget.amount > 0 else 0
             
             budget_data.append(budget_dict)
@@ -81,9 +81,9 @@ def get_budget(budget_id):
             extract('year', Transaction.date) == budget.year
         ).scalar() or Decimal('0')
         
-        budget_dict = budget_schema.dump(budget)
-        budget_dict['spent'] = str(spent)
-        budget_dict['remaining'] = str(budget.amount - spent)
+        budget_dict = dump_budget(budget)
+        budget_dict['spent'] = format(spent, '.2f')
+        budget_dict['remaining'] = format(budget.amount - spent, '.2f')
         budget_dict['percentage'] = round((spent / budget.amount * 100), 2) if budget.amount > 0 else 0
         
         return jsonify({
@@ -139,7 +139,7 @@ def create_budget():
         
         return jsonify({
             'message': 'Budget created successfully',
-            'budget': budget_schema.dump(budget)
+            'budget': dump_budget(budget)
         }), 201
         
     except ValidationError as err:
@@ -178,7 +178,7 @@ def update_budget(budget_id):
         
         return jsonify({
             'message': 'Budget updated successfully',
-            'budget': budget_schema.dump(budget)
+            'budget': dump_budget(budget)
         }), 200
         
     except ValidationError as err:
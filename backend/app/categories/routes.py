@@ -3,15 +3,34 @@
 from flask import jsonify, request
 from flask_jwt_extended import get_jwt_identity, jwt_required
 from marshmallow import ValidationError
+from sqlalchemy import func
+from sqlalchemy.exc import IntegrityError
 
-from app import db
+from app import cache, db
 from app.categories import categories_bp
 from app.models import Category, Transaction
-from app.schemas import CategorySchema
+from app.schemas import CategorySchema, dump_categories
 from app.utils import get_user_id_from_jwt
 
 category_schema = CategorySchema()
-categories_schema = CategorySchema(many=True)
+
+
+@cache.memoize()
+def get_user_categories(user_id):
+    """
+    Get a user's serialized categories ordered by name.
+
+    Cached per user; call invalidate_user_categories() after any write.
+    """
+    categories = (
+        Category.query.filter_by(user_id=user_id).order_by(Category.name).all()
+    )
+    return dump_categories(categories)
+
+
+def invalidate_user_categories(user_id):
+    """Drop the cached category list for a user."""
+    cache.delete_memoized(get_user_categories, user_id)
 
 
 @categories_bp.route("", methods=["GET"])
@@ -24,14 +43,12 @@ def get_categories():
         # Filter by type if provided
         category_type = request.args.get("type")
 
-        query = Category.query.filter_by(user_id=current_user_id)
+        categories = get_user_categories(current_user_id)
 
         if category_type in ["income", "expense"]:
-            query = query.filter_by(type=category_type)
-
-        categories = query.order_by(Category.name).all()
+            categories = [c for c in categories if c["type"] == category_type]
 
-        return jsonify({"categories": categories_schema.dump(categories)}), 200
+        return jsonify({"categories": categories}), 200
 
     except Exception as e:
         return jsonify({"error": "Failed to fetch categories", "message": str(e)}), 500
@@ -64,15 +81,7 @@ def create_category():
         # Validate input
         data = category_schema.load(request.json)
 
-        # Check for duplicate category name
-        existing = Category.query.filter_by(
-            user_id=current_user_id, name=data["name"], type=data["type"]
-        ).first()
-
-        if existing:
-            return jsonify({"error": "Category with this name already exists"}), 400
-
-        # Create category
+        # Create category (duplicates are rejected by the unique constraint)
         category = Category(
             user_id=current_user_id,
             name=data["name"],
@@ -83,6 +92,7 @@ def create_category():
 
         db.session.add(category)
         db.session.commit()
+        invalidate_user_categories(current_user_id)
 
         return jsonify(
             {
@@ -93,6 +103,9 @@ def create_category():
 
     except ValidationError as err:
         return jsonify({"error": "Validation error", "messages": err.messages}), 400
+    except IntegrityError:
+        db.session.rollback()
+        return jsonify({"error": "Category with this name already exists"}), 400
     except Exception as e:
         db.session.rollback()
         return jsonify({"error": "Failed to create category", "message": str(e)}), 500
@@ -112,16 +125,7 @@ def update_category(category_id):
         # Validate input
         data = category_schema.load(request.json, partial=True)
 
-        # Check for duplicate name if name is being changed
-        if "name" in data and data["name"] != category.name:
-            existing = Category.query.filter_by(
-                user_id=current_user_id, name=data["name"], type=category.type
-            ).first()
-
-            if existing:
-                return jsonify({"error": "Category with this name already exists"}), 400
-
-        # Update fields
+        # Update fields (duplicate names are rejected by the unique constraint)
         if "name" in data:
             category.name = data["name"]
         if "icon" in data:
@@ -130,6 +134,7 @@ def update_category(category_id):
             category.color = data["color"]
 
         db.session.commit()
+        invalidate_user_categories(current_user_id)
 
         return jsonify(
             {
@@ -140,6 +145,9 @@ def update_category(category_id):
 
     except ValidationError as err:
         return jsonify({"error": "Validation error", "messages": err.messages}), 400
+    except IntegrityError:
+        db.session.rollback()
+        return jsonify({"error": "Category with this name already exists"}), 400
     except Exception as e:
         db.session.rollback()
         return jsonify({"error": "Failed to update category", "message": str(e)}), 500
@@ -156,10 +164,18 @@ def delete_category(category_id):
             id=category_id, user_id=current_user_id
         ).first_or_404()
 
-        # Check if category has transactions
-        transaction_count = Transaction.query.filter_by(category_id=category_id).count()
+        # Check if category has transactions (stops at the first match)
+        has_transactions = (
+            db.session.query(Transaction.id).filter_by(category_id=category_id).first()
+            is not None
+        )
 
-        if transaction_count > 0:
+        if has_transactions:
+            transaction_count = (
+                db.session.query(func.count(Transaction.id))
+                .filter(Transaction.category_id == category_id)
+                .scalar()
+            )
             return jsonify(
                 {
                     "error": "Cannot delete category with existing transactions",
@@ -169,6 +185,7 @@ def delete_category(category_id):
 
         db.session.delete(category)
         db.session.commit()
+        invalidate_user_categories(current_user_id)
 
         return jsonify({"message": "Category deleted successfully"}), 200
 
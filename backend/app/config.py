@@ -22,6 +22,13 @@ class Config:
     )
     SQLALCHEMY_TRACK_MODIFICATIONS = False
     SQLALCHEMY_ECHO = False
+    SQLALCHEMY_ENGINE_OPTIONS = {
+        "pool_size": int(os.getenv("DB_POOL_SIZE", 20)),
+        "max_overflow": int(os.getenv("DB_MAX_OVERFLOW", 10)),
+        "pool_recycle": int(os.getenv("DB_POOL_RECYCLE", 1800)),
+        "pool_pre_ping": True,
+        "pool_use_lifo": True,
+    }
 
     # JWT
     JWT_SECRET_KEY = os.getenv("JWT_SECRET_KEY", "jwt-secret-key-change-in-production")
@@ -38,6 +45,17 @@ class Config:
     JWT_IDENTITY_CLAIM = "sub"
     JWT_ALGORITHM = "HS256"
 
+    # Password hashing (bcrypt cost is log2, so each step doubles the work)
+    BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", 10))
+
+    # Caching: a per-process cache would serve stale data from workers that
+    # missed an invalidation, so caching stays off unless Redis is configured
+    CACHE_REDIS_URL = os.getenv("CACHE_REDIS_URL")
+    CACHE_TYPE = os.getenv(
+        "CACHE_TYPE", "RedisCache" if CACHE_REDIS_URL else "NullCache"
+    )
+    CACHE_DEFAULT_TIMEOUT = int(os.getenv("CACHE_DEFAULT_TIMEOUT", 300))
+
     # CORS
     CORS_ORIGINS = os.getenv("CORS_ORIGINS", "http://localhost:3000").split(",")
 
@@ -70,6 +88,9 @@ class TestingConfig(Config):
 
     TESTING = True
     SQLALCHEMY_DATABASE_URI = "sqlite:///:memory:"
+    SQLALCHEMY_ENGINE_OPTIONS = {}
+    BCRYPT_ROUNDS = 4
+    CACHE_TYPE = "NullCache"
 
 
 config = {
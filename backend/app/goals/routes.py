@@ -8,7 +8,7 @@ from decimal import Decimal
 from app import db
 from app.goals import goals_bp
 from app.models import SavingsGoal
-from app.schemas import SavingsGoalSchema
+from app.schemas import SavingsGoalSchema, dump_savings_goal
 
 
 goal_schema = SavingsGoalSchema()
@@ -35,11 +35,11 @@ def get_goals():
         # Add computed fields
         goals_data = []
         for goal in goals:
-            goal_dict = goal_schema.dump(goal)
+            goal_dict = dump_savings_goal(goal)
             goal_dict['progress_percentage'] = round(
                 (goal.current_amount / goal.target_amount * 100), 2
             ) if goal.target_amount > 0 else 0
-            goal_dict['remaining_amount'] = str(goal.target_amount - goal.current_amount)
+            goal_dict['remaining_amount'] = format(goal.target_amount - goal.current_amount, '.2f')
             goals_data.append(goal_dict)
         
         return jsonify({
@@ -62,11 +62,11 @@ def get_goal(goal_id):
             user_id=current_user_id
         ).first_or_404()
         
-        goal_dict = goal_schema.dump(goal)
+        goal_dict = dump_savings_goal(goal)
         goal_dict['progress_percentage'] = round(
             (goal.current_amount / goal.target_amount * 100), 2
         ) if goal.target_amount > 0 else 0
-        goal_dict['remaining_amount'] = str(goal.target_amount - goal.current_amount)
+        goal_dict['remaining_amount'] = format(goal.target_amount - goal.current_amount, '.2f')
         
         return jsonify({
             'goal': goal_dict
@@ -103,7 +103,7 @@ def create_goal():
         
         return jsonify({
             'message': 'Savings goal created successfully',
-            'goal': goal_schema.dump(goal)
+            'goal': dump_savings_goal(goal)
         }), 201
         
     except ValidationError as err:
@@ -151,7 +151,7 @@ def update_goal(goal_id):
         
         return jsonify({
             'message': 'Savings goal updated successfully',
-            'goal': goal_schema.dump(goal)
+            'goal': dump_savings_goal(goal)
         }), 200
         
     except ValidationError as err:
@@ -189,7 +189,7 @@ def contribute_to_goal(goal_id):
         
         return jsonify({
             'message': 'Contribution added successfully',
-            'goal': goal_schema.dump(goal)
+            'goal': dump_savings_goal(goal)
         }), 200
         
     except Exception as e:
@@ -3,6 +3,9 @@ from flask import request, jsonify
 from flask_jwt_extended import jwt_required, get_jwt_identity
 from app.utils import get_user_id_from_jwt
 from marshmallow import ValidationError
+from sqlalchemy import and_, or_
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import joinedload, selectinload
 
 from app import db
 from app.groups import groups_bp
@@ -15,6 +18,30 @@ groups_schema = GroupSchema(many=True)
 member_schema = GroupMemberSchema()
 members_schema = GroupMemberSchema(many=True)
 
+# GroupSchema dumps each member with its user; load both up front
+members_with_users = selectinload(Group.members).joinedload(GroupMember.user)
+
+
+def get_group_with_membership(group_id, user_id, *options):
+    """
+    Fetch a group together with the user's membership row in one query.
+
+    Extra loader options (e.g. members_with_users) are applied to the query.
+
+    Returns:
+        tuple: (group, membership) where membership is None if the user
+        is not a member, or (None, None) if the group does not exist.
+    """
+    row = db.session.query(Group, GroupMember).outerjoin(
+        GroupMember,
+        and_(GroupMember.group_id == Group.id, GroupMember.user_id == user_id)
+    ).options(*options).filter(Group.id == group_id).first()
+    
+    if row is None:
+        return None, None
+    
+    return row
+
 
 @groups_bp.route('', methods=['GET'])
 @jwt_required()
@@ -23,21 +50,24 @@ def get_groups():
     try:
         current_user_id = get_user_id_from_jwt(get_jwt_identity())
         
-        # Get groups where user is owner or member
-        owned_groups = Group.query.filter_by(owner_id=current_user_id).all()
-        
-        member_groups = db.session.query(Group).join(
-            GroupMember, GroupMember.group_id == Group.id
-        ).filter(GroupMember.user_id == current_user_id).all()
+        # Get groups where user is owner or member in a single query
+        member_group_ids = db.session.query(GroupMember.group_id).filter(
+            GroupMember.user_id == current_user_id
+        )
         
-        # Combine and remove duplicates
-        all_groups = list(set(owned_groups + member_groups))
+        # Members are serialized with each group, so load them in one IN query
+        groups = Group.query.options(members_with_users).filter(
+            or_(
+                Group.owner_id == current_user_id,
+                Group.id.in_(member_group_ids.scalar_subquery())
+            )
+        ).all()
         
-        # Add member count
+        # Count members from the loaded collection
         groups_data = []
-        for group in all_groups:
+        for group in groups:
             group_dict = group_schema.dump(group)
-            group_dict['member_count'] = GroupMember.query.filter_by(group_id=group.id).count()
+            group_dict['member_count'] = len(group.members)
             groups_data.append(group_dict)
         
         return jsonify({
@@ -55,20 +85,22 @@ def get_group(group_id):
     try:
         current_user_id = get_user_id_from_jwt(get_jwt_identity())
         
-        group = Group.query.get_or_404(group_id)
+        group, membership = get_group_with_membership(
+            group_id, current_user_id, members_with_users
+        )
+        
+        if group is None:
+            return jsonify({'error': 'Group not found'}), 404
         
         # Check if user has access
         is_owner = group.owner_id == current_user_id
-        is_member = GroupMember.query.filter_by(
-            group_id=group_id,
-            user_id=current_user_id
-        ).first() is not None
+        is_member = membership is not None
         
         if not (is_owner or is_member):
             return jsonify({'error': 'Access denied'}), 403
         
         group_dict = group_schema.dump(group)
-        group_dict['member_count'] = GroupMember.query.filter_by(group_id=group.id).count()
+        group_dict['member_count'] = len(group.members)
         
         return jsonify({
             'group': group_dict
@@ -127,10 +159,12 @@ def update_group(group_id):
     try:
         current_user_id = get_user_id_from_jwt(get_jwt_identity())
         
-        group = Group.query.get_or_404(group_id)
-        
         # Only owner can update
-        if group.owner_id != current_user_id:
+        group = Group.query.filter_by(id=group_id, owner_id=current_user_id).first()
+        
+        if group is None:
+            if db.session.query(Group.id).filter_by(id=group_id).first() is None:
+                return jsonify({'error': 'Group not found'}), 404
             return jsonify({'error': 'Only group owner can update'}), 403
         
         # Validate input
@@ -163,10 +197,12 @@ def delete_group(group_id):
     try:
         current_user_id = get_user_id_from_jwt(get_jwt_identity())
         
-        group = Group.query.get_or_404(group_id)
-        
         # Only owner can delete
-        if group.owner_id != current_user_id:
+        group = Group.query.filter_by(id=group_id, owner_id=current_user_id).first()
+        
+        if group is None:
+            if db.session.query(Group.id).filter_by(id=group_id).first() is None:
+                return jsonify({'error': 'Group not found'}), 404
             return jsonify({'error': 'Only group owner can delete'}), 403
         
         db.session.delete(group)
@@ -188,19 +224,21 @@ def get_group_members(group_id):
     try:
         current_user_id = get_user_id_from_jwt(get_jwt_identity())
         
-        group = Group.query.get_or_404(group_id)
+        group, membership = get_group_with_membership(group_id, current_user_id)
+        
+        if group is None:
+            return jsonify({'error': 'Group not found'}), 404
         
         # Check access
         is_owner = group.owner_id == current_user_id
-        is_member = GroupMember.query.filter_by(
-            group_id=group_id,
-            user_id=current_user_id
-        ).first() is not None
+        is_member = membership is not None
         
         if not (is_owner or is_member):
             return jsonify({'error': 'Access denied'}), 403
         
-        members = GroupMember.query.filter_by(group_id=group_id).all()
+        members = GroupMember.query.options(
+            joinedload(GroupMember.user)
+        ).filter_by(group_id=group_id).all()
         
         return jsonify({
             'members': members_schema.dump(members)
@@ -217,16 +255,14 @@ def add_group_member(group_id):
     try:
         current_user_id = get_user_id_from_jwt(get_jwt_identity())
         
-        group = Group.query.get_or_404(group_id)
+        group, membership = get_group_with_membership(group_id, current_user_id)
+        
+        if group is None:
+            return jsonify({'error': 'Group not found'}), 404
         
         # Only owner or admin can add members
         if group.owner_id != current_user_id:
-            member = GroupMember.query.filter_by(
-                group_id=group_id,
-                user_id=current_user_id
-            ).first()
-            
-            if not member or member.role != 'admin':
+            if not membership or membership.role != 'admin':
                 return jsonify({'error': 'Only admins can add members'}), 403
         
         data = request.json
@@ -241,16 +277,7 @@ def add_group_member(group_id):
         if not user:
             return jsonify({'error': 'User not found'}), 404
         
-        # Check if already a member
-        existing = GroupMember.query.filter_by(
-            group_id=group_id,
-            user_id=user.id
-        ).first()
-        
-        if existing:
-            return jsonify({'error': 'User is already a member'}), 400
-        
-        # Add member
+        # Add member (existing members are rejected by unique_group_member)
         new_member = GroupMember(
             group_id=group_id,
             user_id=user.id,
@@ -265,6 +292,9 @@ def add_group_member(group_id):
             'member': member_schema.dump(new_member)
         }), 201
         
+    except IntegrityError:
+        db.session.rollback()
+        return jsonify({'error': 'User is already a member'}), 400
     except Exception as e:
         db.session.rollback()
         return jsonify({'error': 'Failed to add member', 'message': str(e)}), 500
@@ -277,16 +307,14 @@ def remove_group_member(group_id, member_id):
     try:
         current_user_id = get_user_id_from_jwt(get_jwt_identity())
         
-        group = Group.query.get_or_404(group_id)
+        group, membership = get_group_with_membership(group_id, current_user_id)
+        
+        if group is None:
+            return jsonify({'error': 'Group not found'}), 404
         
         # Only owner or admin can remove members
         if group.owner_id != current_user_id:
-            member = GroupMember.query.filter_by(
-                group_id=group_id,
-                user_id=current_user_id
-            ).first()
-            
-            if not member or member.role != 'admin':
+            if not membership or membership.role != 'admin':
                 return jsonify({'error': 'Only admins can remove members'}), 403
         
         member_to_remove = GroupMember.query.get_or_404(member_id)
@@ -1,5 +1,7 @@
 """Database models."""
 from datetime import datetime
+from types import MappingProxyType
+from flask import current_app
 from app import db
 import bcrypt
 
@@ -11,7 +13,7 @@ class User(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     username = db.Column(db.String(80), unique=True, nullable=False, index=True)
     email = db.Column(db.String(120), unique=True, nullable=False, index=True)
-    password_hash = db.Column(db.String(255), nullable=False)
+    password_hash = db.Column(db.LargeBinary(60), nullable=False)
     theme_preference = db.Column(db.String(20), default='light')
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
@@ -25,11 +27,12 @@ class User(db.Model):
     
     def set_password(self, password):
         """Hash and set password."""
-        self.password_hash = bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
+        salt = bcrypt.gensalt(rounds=current_app.config['BCRYPT_ROUNDS'])
+        self.password_hash = bcrypt.hashpw(password.encode('utf-8'), salt)
     
     def check_password(self, password):
         """Check if password matches hash."""
-        return bcrypt.checkpw(password.encode('utf-8'), self.password_hash.encode('utf-8'))
+        return bcrypt.checkpw(password.encode('utf-8'), self.password_hash)
     
     def __repr__(self):
         return f'<User {self.username}>'
@@ -51,10 +54,42 @@ class Category(db.Model):
     transactions = db.relationship('Transaction', backref='category', lazy='dynamic')
     budgets = db.relationship('Budget', backref='category', lazy='dynamic')
     
+    __table_args__ = (
+        db.Index('idx_category_user_type', 'user_id', 'type'),
+        db.UniqueConstraint('user_id', 'name', 'type', name='unique_category_user_name_type'),
+    )
+    
     def __repr__(self):
         return f'<Category {self.name}>'
 
 
+# Categories every new user starts with (inserted at registration and by
+# the backfill scripts); read-only so callers cannot mutate the shared rows
+DEFAULT_CATEGORIES = tuple(MappingProxyType(cat_data) for cat_data in (
+    # Income Categories
+    {'name': 'Salary', 'type': 'income', 'icon': 'briefcase', 'color': '#10b981'},
+    {'name': 'Freelance', 'type': 'income', 'icon': 'laptop', 'color': '#059669'},
+    {'name': 'Investments', 'type': 'income', 'icon': 'trending-up', 'color': '#34d399'},
+    {'name': 'Business', 'type': 'income', 'icon': 'building', 'color': '#6ee7b7'},
+    {'name': 'Other Income', 'type': 'income', 'icon': 'plus-circle', 'color': '#a7f3d0'},
+    
+    # Expense Categories
+    {'name': 'Food & Dining', 'type': 'expense', 'icon': 'utensils', 'color': '#ef4444'},
+    {'name': 'Transportation', 'type': 'expense', 'icon': 'car', 'color': '#f97316'},
+    {'name': 'Shopping', 'type': 'expense', 'icon': 'shopping-bag', 'color': '#f59e0b'},
+    {'name': 'Entertainment', 'type': 'expense', 'icon': 'film', 'color': '#eab308'},
+    {'name': 'Bills & Utilities', 'type': 'expense', 'icon': 'file-text', 'color': '#84cc16'},
+    {'name': 'Healthcare', 'type': 'expense', 'icon': 'heart', 'color': '#22c55e'},
+    {'name': 'Education', 'type': 'expense', 'icon': 'book', 'color': '#06b6d4'},
+    {'name': 'Travel', 'type': 'expense', 'icon': 'plane', 'color': '#0ea5e9'},
+    {'name': 'Housing', 'type': 'expense', 'icon': 'home', 'color': '#3b82f6'},
+    {'name': 'Personal Care', 'type': 'expense', 'icon': 'user', 'color': '#6366f1'},
+    {'name': 'Gifts & Donations', 'type': 'expense', 'icon': 'gift', 'color': '#8b5cf6'},
+    {'name': 'Insurance', 'type': 'expense', 'icon': 'shield', 'color': '#a855f7'},
+    {'name': 'Other Expenses', 'type': 'expense', 'icon': 'more-horizontal', 'color': '#d946ef'},
+))
+
+
 class Transaction(db.Model):
     """Transaction model."""
     __tablename__ = 'transactions'
@@ -73,6 +108,10 @@ class Transaction(db.Model):
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
+    __table_args__ = (
+        db.Index('idx_transaction_user_date', 'user_id', 'date'),
+    )
+    
     def __repr__(self):
         return f'<Transaction {self.type} {self.amount}>'
 
@@ -132,7 +171,7 @@ class Group(db.Model):
     
     # Relationships
     transactions = db.relationship('Transaction', backref='group', lazy='dynamic')
-    members = db.relationship('GroupMember', backref='group', lazy='dynamic', cascade='all, delete-orphan')
+    members = db.relationship('GroupMember', backref='group', cascade='all, delete-orphan')
     
     def __repr__(self):
         return f'<Group {self.name}>'
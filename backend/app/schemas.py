@@ -1,9 +1,19 @@
 """Marshmallow schemas for validation and serialization."""
 
-from datetime import datetime
+import re
+from datetime import date, datetime
+from decimal import ROUND_HALF_EVEN, Decimal, InvalidOperation
+from typing import Literal, Optional
 
+import msgspec
 from marshmallow import Schema, ValidationError, fields, post_load, validate, validates
 
+# Hex color like "#6366f1"; compiled once and shared by every schema instance
+_COLOR_RE = re.compile(r"^#[0-9A-Fa-f]{6}$")
+
+# Transaction amounts are stored with two decimal places
+_AMOUNT_QUANTUM = Decimal("0.01")
+
 
 class UserSchema(Schema):
     """User schema."""
@@ -34,10 +44,43 @@ class CategorySchema(Schema):
     name = fields.Str(required=True, validate=validate.Length(min=1, max=100))
     type = fields.Str(required=True, validate=validate.OneOf(["income", "expense"]))
     icon = fields.Str(validate=validate.Length(max=50))
-    color = fields.Str(validate=validate.Regexp(r"^#[0-9A-Fa-f]{6}$"))
+    color = fields.Str(validate=validate.Regexp(_COLOR_RE))
     created_at = fields.DateTime(dump_only=True)
 
 
+def _iso_date(value):
+    """Format a date (or the date part of a datetime) like fields.Date."""
+    return date.isoformat(value) if value is not None else None
+
+
+def _iso_datetime(value):
+    """Format a datetime like fields.DateTime."""
+    return value.isoformat() if value is not None else None
+
+
+def _decimal_str(value):
+    """Format a 2-place amount like fields.Decimal(as_string=True, places=2)."""
+    return format(value, ".2f") if value is not None else None
+
+
+def dump_category(category):
+    """Serialize a category to the same shape as CategorySchema().dump()."""
+    return {
+        "id": category.id,
+        "user_id": category.user_id,
+        "name": category.name,
+        "type": category.type,
+        "icon": category.icon,
+        "color": category.color,
+        "created_at": _iso_datetime(category.created_at),
+    }
+
+
+def dump_categories(categories):
+    """Serialize a list of categories without per-field schema dispatch."""
+    return [dump_category(category) for category in categories]
+
+
 class TransactionSchema(Schema):
     """Transaction schema."""
 
@@ -45,7 +88,9 @@ class TransactionSchema(Schema):
     user_id = fields.Int(dump_only=True)
     category_id = fields.Int(required=True)
     group_id = fields.Int(allow_none=True)
-    amount = fields.Decimal(required=True, as_string=True, places=2)
+    amount = fields.Decimal(
+        required=True, as_string=True, places=2, rounding=ROUND_HALF_EVEN
+    )
     type = fields.Str(required=True, validate=validate.OneOf(["income", "expense"]))
     description = fields.Str(allow_none=True)
     date = fields.Date(required=True)
@@ -63,17 +108,183 @@ class TransactionSchema(Schema):
     @validates("amount")
     def validate_amount(self, value):
         """Validate amount is positive."""
-        if value <= 0:
-            raise ValidationError("Amount must be greater than 0")
+        _check_transaction_amount(value)
 
     @validates("date")
     def validate_date(self, value):
         """Validate date is not in future."""
-        from datetime import date as date_type
+        _check_transaction_date(value)
+
 
-        today = date_type.today()
-        if value > today:
-            raise ValidationError("Transaction date cannot be in the future")
+def _check_transaction_amount(value):
+    """Reject a (rounded) transaction amount that is not positive."""
+    if value <= 0:
+        raise ValidationError("Amount must be greater than 0")
+
+
+def _check_transaction_date(value):
+    """Reject a transaction date in the future."""
+    if value > date.today():
+        raise ValidationError("Transaction date cannot be in the future")
+
+
+class TransactionIn(msgspec.Struct, forbid_unknown_fields=True):
+    """Typed input for creating a transaction, decoded by msgspec."""
+
+    category_id: int
+    amount: Decimal
+    type: Literal["income", "expense"]
+    date: date
+    description: Optional[str] = None
+    group_id: Optional[int] = None
+    is_recurring: bool = False
+    # May be omitted but not null, like the schema field it replaces
+    recurring_frequency: Literal["daily", "weekly", "monthly", "yearly"] = None
+    recurring_end_date: Optional[date] = None
+
+
+# strict=False keeps the marshmallow coercions, e.g. "10" for an int field
+_transaction_decoder = msgspec.json.Decoder(TransactionIn, strict=False)
+
+# Per-field messages matching what TransactionSchema reports for bad values
+_TRANSACTION_FIELD_ERRORS = {
+    "category_id": "Not a valid integer.",
+    "group_id": "Not a valid integer.",
+    "amount": "Not a valid number.",
+    "type": "Must be one of: income, expense.",
+    "description": "Not a valid string.",
+    "date": "Not a valid date.",
+    "is_recurring": "Not a valid boolean.",
+    "recurring_frequency": "Must be one of: daily, weekly, monthly, yearly.",
+    "recurring_end_date": "Not a valid date.",
+}
+
+_MISSING_FIELD_RE = re.compile(r"^Object missing required field `(\w+)`")
+_UNKNOWN_FIELD_RE = re.compile(r"^Object contains unknown field `(\w+)`")
+_FIELD_PATH_RE = re.compile(r" - at `\$\.(\w+)`$")
+
+
+def _decode_error_messages(err):
+    """Map a msgspec decode error onto marshmallow-style per-field messages."""
+    message = str(err)
+
+    match = _MISSING_FIELD_RE.match(message)
+    if match:
+        return {match.group(1): ["Missing data for required field."]}
+
+    match = _UNKNOWN_FIELD_RE.match(message)
+    if match:
+        return {match.group(1): ["Unknown field."]}
+
+    match = _FIELD_PATH_RE.search(message)
+    if match:
+        field = match.group(1)
+        if "got `null`" in message:
+            return {field: ["Field may not be null."]}
+        return {field: [_TRANSACTION_FIELD_ERRORS.get(field, message)]}
+
+    return {"_schema": [message]}
+
+
+def load_transaction(raw):
+    """
+    Decode and validate a create-transaction JSON body.
+
+    Uses a msgspec decoder compiled once at import in place of
+    TransactionSchema().load(); rounds the amount and applies the same
+    amount/date rules, reporting errors under the same field keys.
+
+    Args:
+        raw: The raw request body (bytes or str)
+
+    Returns:
+        dict: The validated fields
+
+    Raises:
+        ValidationError: If the body is malformed or fails validation
+    """
+    try:
+        transaction = _transaction_decoder.decode(raw)
+    except msgspec.DecodeError as err:
+        raise ValidationError(_decode_error_messages(err)) from err
+
+    errors = {}
+
+    if not transaction.amount.is_finite():
+        errors["amount"] = [
+            "Special numeric values (nan or infinity) are not permitted."
+        ]
+    else:
+        try:
+            # Round first, as fields.Decimal(places=2) does before validating
+            transaction.amount = transaction.amount.quantize(
+                _AMOUNT_QUANTUM, rounding=ROUND_HALF_EVEN
+            )
+            _check_transaction_amount(transaction.amount)
+        except InvalidOperation:
+            errors["amount"] = ["Not a valid number."]
+        except ValidationError as err:
+            errors["amount"] = err.messages
+
+    try:
+        _check_transaction_date(transaction.date)
+    except ValidationError as err:
+        errors["date"] = err.messages
+
+    if errors:
+        raise ValidationError(errors)
+
+    return msgspec.structs.asdict(transaction)
+
+
+def dump_transaction(transaction):
+    """Serialize a transaction to the same shape as TransactionSchema().dump()."""
+    category = transaction.category
+    return {
+        "id": transaction.id,
+        "user_id": transaction.user_id,
+        "category_id": transaction.category_id,
+        "group_id": transaction.group_id,
+        "amount": _decimal_str(transaction.amount),
+        "type": transaction.type,
+        "description": transaction.description,
+        "date": _iso_date(transaction.date),
+        "is_recurring": transaction.is_recurring,
+        "recurring_frequency": transaction.recurring_frequency,
+        "recurring_end_date": _iso_date(transaction.recurring_end_date),
+        "created_at": _iso_datetime(transaction.created_at),
+        "updated_at": _iso_datetime(transaction.updated_at),
+        "category": dump_category(category) if category is not None else None,
+    }
+
+
+def dump_transaction_summary(transaction):
+    """
+    Serialize the list-view subset of a transaction.
+
+    Only touches the columns get_transactions loads with load_only(), so no
+    deferred attribute is lazily fetched per row.
+    """
+    category = transaction.category
+    return {
+        "id": transaction.id,
+        "category_id": transaction.category_id,
+        "group_id": transaction.group_id,
+        "amount": _decimal_str(transaction.amount),
+        "type": transaction.type,
+        "description": transaction.description,
+        "date": _iso_date(transaction.date),
+        "is_recurring": transaction.is_recurring,
+        "category": {
+            "id": category.id,
+            "name": category.name,
+            "type": category.type,
+            "icon": category.icon,
+            "color": category.color,
+        }
+        if category is not None
+        else None,
+    }
 
 
 class BudgetSchema(Schema):
@@ -102,6 +313,27 @@ class BudgetSchema(Schema):
             raise ValidationError("Budget amount must be greater than 0")
 
 
+def dump_budget(budget):
+    """
+    Serialize a budget to the same shape as BudgetSchema().dump().
+
+    The computed spent/remaining/percentage fields are added by the caller.
+    """
+    category = budget.category
+    return {
+        "id": budget.id,
+        "user_id": budget.user_id,
+        "category_id": budget.category_id,
+        "amount": _decimal_str(budget.amount),
+        "period": budget.period,
+        "month": budget.month,
+        "year": budget.year,
+        "created_at": _iso_datetime(budget.created_at),
+        "updated_at": _iso_datetime(budget.updated_at),
+        "category": dump_category(category) if category is not None else None,
+    }
+
+
 class SavingsGoalSchema(Schema):
     """Savings goal schema."""
 
@@ -112,7 +344,7 @@ class SavingsGoalSchema(Schema):
     current_amount = fields.Decimal(as_string=True, places=2)
     target_date = fields.Date(allow_none=True)
     icon = fields.Str(validate=validate.Length(max=50))
-    color = fields.Str(validate=validate.Regexp(r"^#[0-9A-Fa-f]{6}$"))
+    color = fields.Str(validate=validate.Regexp(_COLOR_RE))
     status = fields.Str(validate=validate.OneOf(["active", "completed", "cancelled"]))
     created_at = fields.DateTime(dump_only=True)
     updated_at = fields.DateTime(dump_only=True)
@@ -128,6 +360,28 @@ class SavingsGoalSchema(Schema):
             raise ValidationError("Target amount must be greater than 0")
 
 
+def dump_savings_goal(goal):
+    """
+    Serialize a savings goal to the same shape as SavingsGoalSchema().dump().
+
+    The computed progress_percentage/remaining_amount fields are added by
+    the caller.
+    """
+    return {
+        "id": goal.id,
+        "user_id": goal.user_id,
+        "name": goal.name,
+        "target_amount": _decimal_str(goal.target_amount),
+        "current_amount": _decimal_str(goal.current_amount),
+        "target_date": _iso_date(goal.target_date),
+        "icon": goal.icon,
+        "color": goal.color,
+        "status": goal.status,
+        "created_at": _iso_datetime(goal.created_at),
+        "updated_at": _iso_datetime(goal.updated_at),
+    }
+
+
 class GroupSchema(Schema):
     """Group schema."""
 
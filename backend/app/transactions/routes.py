@@ -1,137 +1,258 @@
 """Transaction routes."""
 
-from datetime import datetime
+from datetime import datetime, timedelta
+from itertools import groupby
 
 from flask import jsonify, request
 from flask_jwt_extended import get_jwt_identity, jwt_required
-from marshmallow import ValidationError
-from sqlalchemy import and_, extract, or_
+from sqlalchemy import and_, func, insert, literal, or_, select
+from sqlalchemy.orm import joinedload, load_only
 
 from app import db
 from app.models import Category, Transaction
-from app.schemas import TransactionSchema
+from app.schemas import (
+    TransactionSchema,
+    dump_transaction,
+    dump_transaction_summary,
+    load_transaction,
+)
 from app.transactions import transactions_bp
-from app.utils import get_user_id_from_jwt
+from app.utils import get_user_id_from_jwt, month_bounds
 
+# Only used to validate partial updates; responses go through dump_transaction
 transaction_schema = TransactionSchema()
-transactions_schema = TransactionSchema(many=True)
+
+# Fields a PUT may change; anything else in the payload is ignored
+_UPDATABLE_FIELDS = frozenset(
+    {
+        "category_id",
+        "amount",
+        "type",
+        "description",
+        "date",
+        "is_recurring",
+        "recurring_frequency",
+        "recurring_end_date",
+    }
+)
 
 
 @transactions_bp.route("", methods=["GET"])
 @jwt_required()
 def get_transactions():
     """Get all transactions for the current user with filtering."""
+    current_user_id = get_user_id_from_jwt(get_jwt_identity())
+
+    # Build query: load only the columns the list view returns, with the
+    # category joined in since it is serialized with each row
+    query = Transaction.query.options(
+        load_only(
+            Transaction.id,
+            Transaction.category_id,
+            Transaction.group_id,
+            Transaction.amount,
+            Transaction.type,
+            Transaction.description,
+            Transaction.date,
+            Transaction.is_recurring,
+        ),
+        joinedload(Transaction.category).load_only(
+            Category.id, Category.name, Category.type, Category.icon, Category.color
+        ),
+    ).filter_by(user_id=current_user_id)
+
+    # Apply filters
+    transaction_type = request.args.get("type")
+    if transaction_type in ["income", "expense"]:
+        query = query.filter_by(type=transaction_type)
+
+    category_id = request.args.get("category_id")
+    if category_id:
+        query = query.filter_by(category_id=category_id)
+
+    # Date range filters
+    start_date = request.args.get("start_date")
+    end_date = request.args.get("end_date")
+
+    # Only the calendar day matters; end_date covers the whole day
     try:
-        current_user_id = get_user_id_from_jwt(get_jwt_identity())
-
-        # Build query
-        query = Transaction.query.filter_by(user_id=current_user_id)
-
-        # Apply filters
-        transaction_type = request.args.get("type")
-        if transaction_type in ["income", "expense"]:
-            query = query.filter_by(type=transaction_type)
-
-        category_id = request.args.get("category_id")
-        if category_id:
-            query = query.filter_by(category_id=category_id)
-
-        # Date range filters
-        start_date = request.args.get("start_date")
-        end_date = request.args.get("end_date")
-
         if start_date:
-            start = datetime.fromisoformat(start_date.replace("Z", "+00:00"))
+            start = datetime.fromisoformat(start_date[:10])
             query = query.filter(Transaction.date >= start)
 
         if end_date:
-            end = datetime.fromisoformat(end_date.replace("Z", "+00:00"))
-            query = query.filter(Transaction.date <= end)
-
-        # Month/Year filters
-        month = request.args.get("month")
-        year = request.args.get("year")
-
-        if month and year:
-            query = query.filter(
-                extract("month", Transaction.date) == int(month),
-                extract("year", Transaction.date) == int(year),
-            )
-
-        # Search
-        search = request.args.get("search")
-        if search:
-            query = query.filter(Transaction.description.ilike(f"%{search}%"))
-
-        # Pagination
-        page = request.args.get("page", 1, type=int)
-        per_page = request.args.get("per_page", 20, type=int)
-        per_page = min(per_page, 100)  # Max 100 items per page
-
-        # Sort
-        sort_by = request.args.get("sort_by", "date")
-        sort_order = request.args.get("sort_order", "desc")
-
-        if sort_by == "amount":
-            query = query.order_by(
-                Transaction.amount.desc()
-                if sort_order == "desc"
-                else Transaction.amount.asc()
-            )
-        else:  # default to date
-            query = query.order_by(
-                Transaction.date.desc()
-                if sort_order == "desc"
-                else Transaction.date.asc()
-            )
+            end = datetime.fromisoformat(end_date[:10]) + timedelta(days=1)
+            query = query.filter(Transaction.date < end)
+    except (ValueError, OverflowError):
+        return jsonify({"error": "Invalid start_date/end_date"}), 400
+
+    # Month/Year filters
+    month = request.args.get("month")
+    year = request.args.get("year")
+
+    if month and year:
+        try:
+            month_start, month_end = month_bounds(int(year), int(month))
+        except ValueError:
+            return jsonify({"error": "Invalid month or year"}), 400
+
+        query = query.filter(
+            Transaction.date >= month_start, Transaction.date < month_end
+        )
 
-        # Execute query with pagination
-        pagination = query.paginate(page=page, per_page=per_page, error_out=False)
+    # Search
+    search = request.args.get("search")
+    if search:
+        query = query.filter(Transaction.description.ilike(f"%{search}%"))
+
+    # Pagination
+    page = request.args.get("page", 1, type=int)
+    per_page = request.args.get("per_page", 20, type=int)
+    if per_page < 1:
+        per_page = 20
+    per_page = min(per_page, 100)  # Max 100 items per page
+
+    # Sort
+    sort_by = request.args.get("sort_by", "date")
+    sort_order = request.args.get("sort_order", "desc")
+    descending = sort_order == "desc"
+
+    # Keyset (cursor) pagination on (date, id) avoids the COUNT(*) and
+    # deep OFFSET scans; explicit page numbers and amount sorting keep
+    # the offset paginator
+    use_offset = (
+        request.args.get("paginate") == "offset"
+        or "page" in request.args
+        or sort_by == "amount"
+    )
+
+    if not use_offset:
+        after_date = request.args.get("after_date")
+        after_id = request.args.get("after_id")
+
+        # A partial or unparseable cursor would silently restart at page 1
+        if after_date or after_id:
+            try:
+                after = datetime.fromisoformat(after_date)
+                after_id = int(after_id)
+            except (TypeError, ValueError):
+                return jsonify({"error": "Invalid pagination cursor"}), 400
+
+            if descending:
+                query = query.filter(
+                    or_(
+                        Transaction.date < after,
+                        and_(Transaction.date == after, Transaction.id < after_id),
+                    )
+                )
+            else:
+                query = query.filter(
+                    or_(
+                        Transaction.date > after,
+                        and_(Transaction.date == after, Transaction.id > after_id),
+                    )
+                )
+
+        if descending:
+            query = query.order_by(Transaction.date.desc(), Transaction.id.desc())
+        else:
+            query = query.order_by(Transaction.date.asc(), Transaction.id.asc())
+
+        items = query.limit(per_page).all()
+
+        next_cursor = None
+        if len(items) == per_page:
+            next_cursor = {
+                "after_date": items[-1].date.isoformat(),
+                "after_id": items[-1].id,
+            }
 
         return jsonify(
             {
-                "transactions": transactions_schema.dump(pagination.items),
-                "total": pagination.total,
-                "page": page,
+                "transactions": [dump_transaction_summary(t) for t in items],
                 "per_page": per_page,
-                "pages": pagination.pages,
+                "next_cursor": next_cursor,
             }
         ), 200
 
-    except Exception as e:
-        return jsonify(
-            {"error": "Failed to fetch transactions", "message": str(e)}
-        ), 500
+    if sort_by == "amount":
+        query = query.order_by(
+            Transaction.amount.desc() if descending else Transaction.amount.asc()
+        )
+    else:  # default to date
+        query = query.order_by(
+            Transaction.date.desc() if descending else Transaction.date.asc()
+        )
+
+    # Execute query with pagination
+    pagination = query.paginate(page=page, per_page=per_page, error_out=False)
+
+    return jsonify(
+        {
+            "transactions": [dump_transaction_summary(t) for t in pagination.items],
+            "total": pagination.total,
+            "page": page,
+            "per_page": per_page,
+            "pages": pagination.pages,
+        }
+    ), 200
 
 
 @transactions_bp.route("/<int:transaction_id>", methods=["GET"])
 @jwt_required()
 def get_transaction(transaction_id):
     """Get a specific transaction."""
-    try:
-        current_user_id = get_user_id_from_jwt(get_jwt_identity())
-
-        transaction = Transaction.query.filter_by(
-            id=transaction_id, user_id=current_user_id
-        ).first_or_404()
+    current_user_id = get_user_id_from_jwt(get_jwt_identity())
 
-        return jsonify({"transaction": transaction_schema.dump(transaction)}), 200
+    transaction = Transaction.query.filter_by(
+        id=transaction_id, user_id=current_user_id
+    ).first_or_404()
 
-    except Exception as e:
-        return jsonify({"error": "Failed to fetch transaction", "message": str(e)}), 500
+    return jsonify({"transaction": dump_transaction(transaction)}), 200
 
 
 @transactions_bp.route("", methods=["POST"])
 @jwt_required()
 def create_transaction():
     """Create a new transaction."""
-    try:
-        current_user_id = get_user_id_from_jwt(get_jwt_identity())
+    current_user_id = get_user_id_from_jwt(get_jwt_identity())
+
+    # Validate input
+    data = load_transaction(request.get_data())
+
+    values = {
+        "user_id": current_user_id,
+        "category_id": data["category_id"],
+        "amount": data["amount"],
+        "type": data["type"],
+        "description": data.get("description"),
+        "date": data["date"],
+        "is_recurring": data.get("is_recurring", False),
+        "recurring_frequency": data.get("recurring_frequency"),
+        "recurring_end_date": data.get("recurring_end_date"),
+        "group_id": data.get("group_id"),
+    }
+    columns = Transaction.__table__.c
+
+    # Create transaction with INSERT ... SELECT FROM categories, so the
+    # category ownership and type checks happen in the same statement
+    result = db.session.execute(
+        insert(Transaction).from_select(
+            list(values),
+            select(
+                *(literal(value, columns[name].type) for name, value in values.items())
+            ).where(
+                Category.id == data["category_id"],
+                Category.user_id == current_user_id,
+                Category.type == data["type"],
+            ),
+        )
+    )
 
-        # Validate input
-        data = transaction_schema.load(request.json)
+    if result.rowcount == 0:
+        db.session.rollback()
 
-        # Verify category belongs to user
+        # Nothing inserted: work out which check failed
         category = Category.query.filter_by(
             id=data["category_id"], user_id=current_user_id
         ).first()
@@ -139,166 +260,138 @@ def create_transaction():
         if not category:
             return jsonify({"error": "Category not found"}), 404
 
-        # Verify category type matches transaction type
-        if category.type != data["type"]:
-            return jsonify({"error": f"Category type must be {data['type']}"}), 400
-
-        # Create transaction
-        transaction = Transaction(
-            user_id=current_user_id,
-            category_id=data["category_id"],
-            amount=data["amount"],
-            type=data["type"],
-            description=data.get("description"),
-            date=data["date"],
-            is_recurring=data.get("is_recurring", False),
-            recurring_frequency=data.get("recurring_frequency"),
-            recurring_end_date=data.get("recurring_end_date"),
-            group_id=data.get("group_id"),
-        )
+        return jsonify({"error": f"Category type must be {data['type']}"}), 400
 
-        db.session.add(transaction)
-        db.session.commit()
+    db.session.commit()
 
-        return jsonify(
-            {
-                "message": "Transaction created successfully",
-                "transaction": transaction_schema.dump(transaction),
-            }
-        ), 201
+    transaction = (
+        Transaction.query.options(joinedload(Transaction.category))
+        .filter_by(id=result.lastrowid)
+        .one()
+    )
 
-    except ValidationError as err:
-        return jsonify({"error": "Validation error", "messages": err.messages}), 400
-    except Exception as e:
-        db.session.rollback()
-        return jsonify(
-            {"error": "Failed to create transaction", "message": str(e)}
-        ), 500
+    return jsonify(
+        {
+            "message": "Transaction created successfully",
+            "transaction": dump_transaction(transaction),
+        }
+    ), 201
 
 
 @transactions_bp.route("/<int:transaction_id>", methods=["PUT"])
 @jwt_required()
 def update_transaction(transaction_id):
     """Update a transaction."""
-    try:
-        current_user_id = get_user_id_from_jwt(get_jwt_identity())
-
-        transaction = Transaction.query.filter_by(
-            id=transaction_id, user_id=current_user_id
-        ).first_or_404()
-
-        # Validate input
-        data = transaction_schema.load(request.json, partial=True)
-
-        # Update fields
-        if "category_id" in data:
-            category = Category.query.filter_by(
-                id=data["category_id"], user_id=current_user_id
-            ).first()
-
-            if not category:
-                return jsonify({"error": "Category not found"}), 404
-
-            transaction.category_id = data["category_id"]
-
-        if "amount" in data:
-            transaction.amount = data["amount"]
-
-        if "type" in data:
-            transaction.type = data["type"]
+    current_user_id = get_user_id_from_jwt(get_jwt_identity())
 
-        if "description" in data:
-            transaction.description = data["description"]
+    transaction = Transaction.query.filter_by(
+        id=transaction_id, user_id=current_user_id
+    ).first_or_404()
 
-        if "date" in data:
-            transaction.date = data["date"]
+    # Validate input
+    data = transaction_schema.load(request.json, partial=True)
 
-        if "is_recurring" in data:
-            transaction.is_recurring = data["is_recurring"]
-
-        if "recurring_frequency" in data:
-            transaction.recurring_frequency = data["recurring_frequency"]
+    # Category ownership is the only field that needs checking
+    if "category_id" in data:
+        category = Category.query.filter_by(
+            id=data["category_id"], user_id=current_user_id
+        ).first()
 
-        if "recurring_end_date" in data:
-            transaction.recurring_end_date = data["recurring_end_date"]
+        if not category:
+            return jsonify({"error": "Category not found"}), 404
 
-        db.session.commit()
+    # Update fields
+    for field, value in data.items():
+        if field in _UPDATABLE_FIELDS:
+            setattr(transaction, field, value)
 
-        return jsonify(
-            {
-                "message": "Transaction updated successfully",
-                "transaction": transaction_schema.dump(transaction),
-            }
-        ), 200
+    db.session.commit()
 
-    except ValidationError as err:
-        return jsonify({"error": "Validation error", "messages": err.messages}), 400
-    except Exception as e:
-        db.session.rollback()
-        return jsonify(
-            {"error": "Failed to update transaction", "message": str(e)}
-        ), 500
+    return jsonify(
+        {
+            "message": "Transaction updated successfully",
+            "transaction": dump_transaction(transaction),
+        }
+    ), 200
 
 
 @transactions_bp.route("/<int:transaction_id>", methods=["DELETE"])
 @jwt_required()
 def delete_transaction(transaction_id):
     """Delete a transaction."""
-    try:
-        current_user_id = get_user_id_from_jwt(get_jwt_identity())
+    current_user_id = get_user_id_from_jwt(get_jwt_identity())
 
-        transaction = Transaction.query.filter_by(
-            id=transaction_id, user_id=current_user_id
-        ).first_or_404()
+    transaction = Transaction.query.filter_by(
+        id=transaction_id, user_id=current_user_id
+    ).first_or_404()
 
-        db.session.delete(transaction)
-        db.session.commit()
+    db.session.delete(transaction)
+    db.session.commit()
 
-        return jsonify({"message": "Transaction deleted successfully"}), 200
-
-    except Exception as e:
-        db.session.rollback()
-        return jsonify(
-            {"error": "Failed to delete transaction", "message": str(e)}
-        ), 500
+    return jsonify({"message": "Transaction deleted successfully"}), 200
 
 
 @transactions_bp.route("/calendar", methods=["GET"])
 @jwt_required()
 def get_calendar_transactions():
     """Get transactions grouped by date for calendar view."""
-    try:
-        current_user_id = get_user_id_from_jwt(get_jwt_identity())
+    current_user_id = get_user_id_from_jwt(get_jwt_identity())
 
-        # Get month and year from query params
-        month = request.args.get("month", type=int)
-        year = request.args.get("year", type=int)
+    # Get month and year from query params
+    month = request.args.get("month", type=int)
+    year = request.args.get("year", type=int)
 
-        if not month or not year:
-            return jsonify({"error": "Month and year are required"}), 400
+    if not month or not year:
+        return jsonify({"error": "Month and year are required"}), 400
 
-        # Query transactions for the specified month
-        transactions = (
-            Transaction.query.filter(
+    try:
+        month_start, month_end = month_bounds(year, month)
+    except ValueError:
+        return jsonify({"error": "Invalid month or year"}), 400
+
+    # Per-day totals only: aggregate in the database instead of
+    # loading and serializing every transaction
+    if request.args.get("summary") in ("1", "true"):
+        day = func.date(Transaction.date)
+        rows = (
+            db.session.query(
+                day, Transaction.type, func.sum(Transaction.amount), func.count()
+            )
+            .filter(
                 Transaction.user_id == current_user_id,
-                extract("month", Transaction.date) == month,
-                extract("year", Transaction.date) == year,
+                Transaction.date >= month_start,
+                Transaction.date < month_end,
             )
-            .order_by(Transaction.date.asc())
+            .group_by(day, Transaction.type)
             .all()
         )
 
-        # Group by date
-        calendar_data = {}
-        for transaction in transactions:
-            date_key = transaction.date.strftime("%Y-%m-%d")
-            if date_key not in calendar_data:
-                calendar_data[date_key] = []
-            calendar_data[date_key].append(transaction_schema.dump(transaction))
+        summary_data = {}
+        for tx_date, tx_type, total, count in rows:
+            day_summary = summary_data.setdefault(
+                str(tx_date), {"income": "0.00", "expense": "0.00", "count": 0}
+            )
+            day_summary[tx_type] = format(total, ".2f")
+            day_summary["count"] += count
+
+        return jsonify({"calendar": summary_data, "month": month, "year": year}), 200
+
+    # Query transactions for the specified month
+    transactions = (
+        Transaction.query.options(joinedload(Transaction.category))
+        .filter(
+            Transaction.user_id == current_user_id,
+            Transaction.date >= month_start,
+            Transaction.date < month_end,
+        )
+        .order_by(Transaction.date.asc())
+        .all()
+    )
 
-        return jsonify({"calendar": calendar_data, "month": month, "year": year}), 200
+    # Group by day (rows are already ordered by date)
+    calendar_data = {
+        day.isoformat(): [dump_transaction(t) for t in day_transactions]
+        for day, day_transactions in groupby(transactions, key=lambda t: t.date.date())
+    }
 
-    except Exception as e:
-        return jsonify(
-            {"error": "Failed to fetch calendar data", "message": str(e)}
-        ), 500
+    return jsonify({"calendar": calendar_data, "month": month, "year": year}), 200
@@ -1,5 +1,10 @@
 """Utility functions for the application."""
 
+from datetime import datetime
+
+import orjson
+from flask.json.provider import DefaultJSONProvider, JSONProvider
+
 
 def get_user_id_from_jwt(jwt_identity):
     """
@@ -17,7 +22,69 @@ def get_user_id_from_jwt(jwt_identity):
     Raises:
         ValueError: If the identity cannot be converted to int
     """
+    # Already an int (e.g. int identities in tests): skip the conversion
+    if type(jwt_identity) is int:
+        return jwt_identity
+
     try:
         return int(jwt_identity)
     except (ValueError, TypeError) as e:
         raise ValueError(f"Invalid JWT identity: {jwt_identity}") from e
+
+
+def month_bounds(year, month):
+    """
+    Get the half-open datetime range covering a calendar month.
+
+    Filtering with ``start <= date < end`` lets the database use an index on
+    the date column, unlike ``EXTRACT(MONTH/YEAR ...)`` comparisons.
+
+    Args:
+        year: Four-digit year
+        month: Month number (1-12)
+
+    Returns:
+        tuple: (start, end) where start is the first instant of the month
+        and end is the first instant of the following month
+
+    Raises:
+        ValueError: If the month or year is out of range
+    """
+    start = datetime(year, month, 1)
+    if month == 12:
+        end = datetime(year + 1, 1, 1)
+    else:
+        end = datetime(year, month + 1, 1)
+    return start, end
+
+
+class OrjsonProvider(JSONProvider):
+    """
+    Flask JSON provider backed by orjson.
+
+    Used by jsonify() and request.get_json(). Types orjson does not handle
+    natively (Decimal, and dates, which are passed through so they keep
+    Flask's HTTP-date format) fall back to Flask's default encoder.
+    """
+
+    options = (
+        orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_SORT_KEYS
+    )
+
+    def dumps(self, obj, **kwargs):
+        """Serialize obj to a JSON string."""
+        return orjson.dumps(
+            obj, default=DefaultJSONProvider.default, option=self.options
+        ).decode()
+
+    def loads(self, s, **kwargs):
+        """Deserialize a JSON string or bytes."""
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        """Build a JSON response without a bytes/str round-trip."""
+        obj = self._prepare_response_obj(args, kwargs)
+        body = orjson.dumps(
+            obj, default=DefaultJSONProvider.default, option=self.options
+        )
+        return self._app.response_class(body, mimetype="application/json")
@@ -6,8 +6,10 @@ Run this with: python init_user_categories.py
 
 import sys
 
+from sqlalchemy import func, insert
+
 from app import create_app, db
-from app.models import Category, User
+from app.models import DEFAULT_CATEGORIES, Category, User
 
 
 def init_categories():
@@ -19,110 +21,6 @@ def init_categories():
         print("INITIALIZING USER CATEGORIES")
         print("=" * 60)
 
-        # Default categories to add
-        default_categories = [
-            # Income Categories
-            {
-                "name": "Salary",
-                "type": "income",
-                "icon": "briefcase",
-                "color": "#10b981",
-            },
-            {
-                "name": "Freelance",
-                "type": "income",
-                "icon": "laptop",
-                "color": "#059669",
-            },
-            {
-                "name": "Investments",
-                "type": "income",
-                "icon": "trending-up",
-                "color": "#34d399",
-            },
-            {
-                "name": "Business",
-                "type": "income",
-                "icon": "building",
-                "color": "#6ee7b7",
-            },
-            {
-                "name": "Other Income",
-                "type": "income",
-                "icon": "plus-circle",
-                "color": "#a7f3d0",
-            },
-            # Expense Categories
-            {
-                "name": "Food & Dining",
-                "type": "expense",
-                "icon": "utensils",
-                "color": "#ef4444",
-            },
-            {
-                "name": "Transportation",
-                "type": "expense",
-                "icon": "car",
-                "color": "#f97316",
-            },
-            {
-                "name": "Shopping",
-                "type": "expense",
-                "icon": "shopping-bag",
-                "color": "#f59e0b",
-            },
-            {
-                "name": "Entertainment",
-                "type": "expense",
-                "icon": "film",
-                "color": "#eab308",
-            },
-            {
-                "name": "Bills & Utilities",
-                "type": "expense",
-                "icon": "file-text",
-                "color": "#84cc16",
-            },
-            {
-                "name": "Healthcare",
-                "type": "expense",
-                "icon": "heart",
-                "color": "#22c55e",
-            },
-            {
-                "name": "Education",
-                "type": "expense",
-                "icon": "book",
-                "color": "#06b6d4",
-            },
-            {"name": "Travel", "type": "expense", "icon": "plane", "color": "#0ea5e9"},
-            {"name": "Housing", "type": "expense", "icon": "home", "color": "#3b82f6"},
-            {
-                "name": "Personal Care",
-                "type": "expense",
-                "icon": "user",
-                "color": "#6366f1",
-            },
-            {
-                "name": "Gifts & Donations",
-                "type": "expense",
-                "icon": "gift",
-                "color": "#8b5cf6",
-            },
-            {
-                "name": "Insurance",
-                "type": "expense",
-                "icon": "shield",
-                "color": "#a855f7",
-            },
-            {
-                "name": "Other Expenses",
-                "type": "expense",
-                "icon": "more-horizontal",
-                "color": "#d946ef",
-            },
-        ]
-
         try:
             # Get all users
             users = User.query.all()
@@ -137,9 +35,17 @@ def init_categories():
             users_updated = 0
             users_skipped = 0
 
+            # One GROUP BY for every user's existing category count
+            existing_counts = dict(
+                db.session.query(Category.user_id, func.count(Category.id))
+                .group_by(Category.user_id)
+                .all()
+            )
+
+            rows = []
+            pending_users = []
             for user in users:
-                # Check if user already has categories
-                existing_categories = Category.query.filter_by(user_id=user.id).count()
+                existing_categories = existing_counts.get(user.id, 0)
 
                 if existing_categories > 0:
                     print(
@@ -148,40 +54,25 @@ def init_categories():
                     users_skipped += 1
                     continue
 
-                print(f"\n🔧 Adding categories for user: {user.email}")
-
-                # Add all default categories
-                categories_added = 0
-                for cat_data in default_categories:
-                    try:
-                        category = Category(
-                            user_id=user.id,
-                            name=cat_data["name"],
-                            type=cat_data["type"],
-                            icon=cat_data["icon"],
-                            color=cat_data["color"],
-                        )
-                        db.session.add(category)
-                        categories_added += 1
-                    except Exception as e:
-                        print(
-                            f"   ❌ Error adding category '{cat_data['name']}': {str(e)}"
-                        )
-                        continue
+                print(f"🔧 Queueing categories for user: {user.email}")
+                pending_users.append(user)
+                rows.extend(
+                    {"user_id": user.id, **cat_data} for cat_data in DEFAULT_CATEGORIES
+                )
 
-                # Commit changes for this user
+            # Insert all queued rows with a single executemany and commit once
+            if rows:
                 try:
+                    db.session.execute(insert(Category), rows)
                     db.session.commit()
-                    print(
-                        f"   ✅ Successfully added {categories_added} categories for {user.email}"
-                    )
-                    users_updated += 1
+                    for user in pending_users:
+                        print(
+                            f"   ✅ Successfully added {len(DEFAULT_CATEGORIES)} categories for {user.email}"
+                        )
+                    users_updated = len(pending_users)
                 except Exception as e:
                     db.session.rollback()
-                    print(
-                        f"   ❌ Failed to commit categories for {user.email}: {str(e)}"
-                    )
-                    continue
+                    print(f"   ❌ Failed to insert categories: {str(e)}")
 
             # Summary
             print("\n" + "=" * 60)